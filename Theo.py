@@ -6,8 +6,14 @@ import schedule
 import telebot
 import json
 import random
+import functools
 import logging
 import re  # <--- CRITICAL IMPORT
+import sqlite3
+import queue
+import atexit
+from abc import ABC, abstractmethod
+from logging.handlers import QueueHandler, QueueListener
 from flask import Flask
 import certifi
 from pymongo import MongoClient
@@ -20,22 +26,145 @@ TOKEN = os.getenv("BOT_TOKEN")
 MONGO_URI = os.getenv("MONGO_URI")
 # Add ADMIN_ID to your .env file to secure the force_verse command
 ADMIN_ID = int(os.getenv("ADMIN_ID", 0))
+# Optional: path to a SQLite file, used when MONGO_URI is not set
+SQLITE_PATH = os.getenv("SQLITE_PATH")
 
-# Setup Enhanced Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+# Logging: "json" (one structured line per record) or "text" (classic format)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+# Repeated warnings/errors: let a burst through, then keep 1 in N per window
+LOG_RATE_WINDOW = int(os.getenv("LOG_RATE_WINDOW", 60))  # seconds
+LOG_RATE_BURST = int(os.getenv("LOG_RATE_BURST", 10))
+LOG_SAMPLE_EVERY = int(os.getenv("LOG_SAMPLE_EVERY", 100))
+
+# --- LOGGING PIPELINE ---
+
+class JsonFormatter(logging.Formatter):
+    """Renders each record as a single JSON line with chat/handler context"""
+    CONTEXT_FIELDS = ("chat_id", "handler", "user_id", "reference", "suppressed")
+
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in self.CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+class TextFormatter(logging.Formatter):
+    """Classic one-line format that still reports how many records were sampled away"""
+    def __init__(self):
+        super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        suppressed = getattr(record, "suppressed", None)
+        if suppressed:
+            line += f" [{suppressed} similar suppressed]"
+        return line
+
+class RateLimitFilter(logging.Filter):
+    """Samples repeated WARNING+ records so failure storms don't flood the writer.
+
+    Records are grouped by their unformatted template, so every
+    "Failed to send to %s" shares one bucket regardless of chat.
+    """
+    def __init__(self, window=LOG_RATE_WINDOW, burst=LOG_RATE_BURST, sample_every=LOG_SAMPLE_EVERY):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.sample_every = max(1, sample_every)
+        self._lock = threading.Lock()
+        self._buckets = {}  # key -> [window_start, seen, suppressed]
+
+    def filter(self, record):
+        if record.levelno < logging.WARNING:
+            return True
+
+        # msg is normally a str template, but logger.error({...}) is legal too
+        msg = record.msg if isinstance(record.msg, str) else str(record.msg)
+        key = (record.name, record.levelno, msg)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or record.created - bucket[0] >= self.window:
+                carried = bucket[2] if bucket else 0
+                bucket = [record.created, 0, carried]
+                self._buckets[key] = bucket
+
+            bucket[1] += 1
+            if bucket[1] <= self.burst or bucket[1] % self.sample_every == 0:
+                if bucket[2]:
+                    record.suppressed = bucket[2]
+                    bucket[2] = 0
+                return True
+
+            bucket[2] += 1
+            return False
+
+class DeferredQueueHandler(QueueHandler):
+    """Enqueues records untouched so %-formatting runs on the writer thread"""
+    def prepare(self, record):
+        # The queue never leaves this process, so there is nothing to pickle
+        return record
+
+def setup_logging():
+    """Routes all logging through a queue drained by a background writer thread"""
+    if LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = TextFormatter()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    root.handlers[:] = [queue_handler]
+
+    # TeleBot attaches its own synchronous stderr handler; let it flow through ours instead
+    telebot_logger = logging.getLogger("TeleBot")
+    telebot_logger.handlers.clear()
+    telebot_logger.propagate = True
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush whatever is still queued on exit
+    return listener
+
+log_listener = setup_logging()
 logger = logging.getLogger(__name__)
 
 # --- CONSTANTS ---
 BIBLE_API_URL = "https://bible-api.com"
-BIBLE_TRANSLATION = "web"
+BIBLE_TRANSLATION = "web"  # Default for chats that haven't picked one
+SUPPORTED_TRANSLATIONS = ("web", "kjv", "bbe")
 MORNING_VERSE_TIME = "05:00"  # UTC (06:00 Nigeria Time)
 VERSES_FILE = "encouraging_verses.json"
+SQLITE_FLUSH_INTERVAL = 1.0  # seconds between batched SQLite commits
+SQLITE_BATCH_SIZE = 100  # commit early once this many writes are queued
+VERSE_MARKUP_CACHE_SIZE = 512  # memoized (verse, translation) keyboards
+CALLBACK_DATA_LIMIT = 64  # Telegram's max callback_data size in bytes
+ADMIN_CACHE_TTL = 600  # seconds a chat's admin list is trusted without re-fetching
+ADMIN_STATUSES = ("administrator", "creator")
+MENU_BUTTONS = ("Get Verse", "Subscribe", "Check Status", "Help")
+POLL_TIMEOUT = 60  # long-polling timeout in seconds
+POLL_PAGE_SIZE = 100  # getUpdates page size (Telegram's maximum)
+POLL_STALE_AFTER = int(os.getenv("POLL_STALE_AFTER", 300))  # ignore chatter older than this (seconds)
+POLL_BACKOFF_MIN = 1  # seconds; doubles on every consecutive polling failure
+POLL_BACKOFF_MAX = 300
+POLL_DRAIN_TIMEOUT = 1  # long-polling timeout while draining the startup backlog
+POLL_LAG_WINDOW = 300  # seconds covered by the max_lag_seconds metric
 
 # --- SMART LISTENING CONFIGURATION ---
 # 1. The Book List Pattern
@@ -122,6 +251,62 @@ DEFAULT_VERSE = {
     "text": "The LORD is my shepherd, I lack nothing."
 }
 
+# --- COMPACT VERSE IDS ---
+# Canonical book order; a book's ID is its 1-based position in this list
+BIBLE_BOOKS = (
+    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy", "Joshua", "Judges",
+    "Ruth", "1 Samuel", "2 Samuel", "1 Kings", "2 Kings", "1 Chronicles",
+    "2 Chronicles", "Ezra", "Nehemiah", "Esther", "Job", "Psalms", "Proverbs",
+    "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah", "Lamentations",
+    "Ezekiel", "Daniel", "Hosea", "Joel", "Amos", "Obadiah", "Jonah", "Micah",
+    "Nahum", "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi",
+    "Matthew", "Mark", "Luke", "John", "Acts", "Romans", "1 Corinthians",
+    "2 Corinthians", "Galatians", "Ephesians", "Philippians", "Colossians",
+    "1 Thessalonians", "2 Thessalonians", "1 Timothy", "2 Timothy", "Titus",
+    "Philemon", "Hebrews", "James", "1 Peter", "2 Peter", "1 John", "2 John",
+    "3 John", "Jude", "Revelation"
+)
+BOOK_IDS = {name.lower(): i for i, name in enumerate(BIBLE_BOOKS, start=1)}
+BOOK_IDS.update({"psalm": 19, "song of songs": 22, "revelations": 66})
+
+REFERENCE_REGEX = re.compile(r"^\s*(.+?)\s+(\d+)(?::(\d+)(?:\s*-\s*(\d+))?)?\s*$")
+
+def encode_verse_id(reference):
+    """Packs 'Book C:V-W' into one int (8 bits each for book, chapter, V, W).
+
+    Returns None for references that don't fit, e.g. ranges spanning chapters.
+    """
+    match = REFERENCE_REGEX.match(reference)
+    if not match:
+        return None
+    book = BOOK_IDS.get(match.group(1).lower())
+    chapter = int(match.group(2))
+    start = int(match.group(3) or 0)
+    end = int(match.group(4) or start)
+    if match.group(3) is not None and start == 0:
+        return None  # "John 3:0" would decode as the whole chapter
+    if book is None or not (0 < chapter < 256 and 0 <= start <= end < 256):
+        return None
+    return (book << 24) | (chapter << 16) | (start << 8) | end
+
+def decode_verse_id(verse_id):
+    """Inverse of encode_verse_id: returns a reference the Bible API understands.
+
+    Raises ValueError for IDs encode_verse_id could never have produced.
+    """
+    book_id = verse_id >> 24
+    chapter = (verse_id >> 16) & 0xFF
+    start = (verse_id >> 8) & 0xFF
+    end = verse_id & 0xFF
+    if not (1 <= book_id <= len(BIBLE_BOOKS)) or chapter == 0 or end < start or (start == 0 and end != 0):
+        raise ValueError(f"Invalid verse ID: {verse_id}")
+    book = BIBLE_BOOKS[book_id - 1]
+    if not start:
+        return f"{book} {chapter}"
+    if end == start:
+        return f"{book} {chapter}:{start}"
+    return f"{book} {chapter}:{start}-{end}"
+
 # --- INITIALIZE BOT ---
 bot = telebot.TeleBot(TOKEN, parse_mode="Markdown")
 
@@ -129,43 +314,217 @@ bot = telebot.TeleBot(TOKEN, parse_mode="Markdown")
 try:
     BOT_INFO = bot.get_me()
     BOT_ID = BOT_INFO.id
-    logger.info(f"Bot Identity Verified: {BOT_INFO.first_name} (ID: {BOT_ID})")
+    logger.info("Bot Identity Verified: %s (ID: %s)", BOT_INFO.first_name, BOT_ID)
 except Exception as e:
-    logger.critical(f"Failed to get Bot ID: {e}")
+    logger.critical("Failed to get Bot ID: %s", e)
     BOT_ID = 0
 
 # --- DATABASE CLASSES ---
 
-class MockDatabase:
-    """A Fake Database for Local Testing (Used when Real DB fails)"""
+class SubscriberStore(ABC):
+    """Common interface for every subscriber backend (MongoDB, SQLite, in-memory)"""
+    backend = "unknown"
+
+    @abstractmethod
+    def add_group(self, chat_id, chat_name, joined_date):
+        """Subscribe a chat. Returns True if it was new, False if already present"""
+
+    @abstractmethod
+    def remove_group(self, chat_id):
+        """Unsubscribe a chat. Returns True if something was removed"""
+
+    @abstractmethod
+    def get_all_groups(self):
+        """Return every subscription document as a list of dicts"""
+
+    @abstractmethod
+    def get_translation(self, chat_id):
+        """Return a chat's default translation from memory (None if not subscribed)"""
+
+    @abstractmethod
+    def set_translation(self, chat_id, translation):
+        """Set a chat's default translation. Returns False if it isn't subscribed"""
+
+    def ping(self):
+        """Raise if the backing service is unreachable"""
+        return None
+
+class InMemoryDatabase(SubscriberStore):
+    """Dict-indexed store keyed by chat id: O(1) add/remove/lookup, no durability"""
+    backend = "memory"
+
     def __init__(self):
-        self.groups = []
-        logger.warning("WARNING: RUNNING IN DUMMY MODE (Mock DB). Data will be lost on restart.")
+        self.groups = {}
+        self._lock = threading.Lock()
 
     def add_group(self, chat_id, chat_name, joined_date):
-        for g in self.groups:
-            if g["_id"] == chat_id:
+        with self._lock:
+            if chat_id in self.groups:
                 return False
-        self.groups.append({"_id": chat_id, "name": chat_name, "joined_at": joined_date})
-        logger.info(f"Mock DB: Added group {chat_name}")
+            self.groups[chat_id] = {
+                "_id": chat_id,
+                "name": chat_name,
+                "joined_at": joined_date,
+                "translation": BIBLE_TRANSLATION,
+                "created_at": datetime.now(timezone.utc)
+            }
+            self._group_added(self.groups[chat_id])
+        logger.info("Added new group: %s (%s)", chat_name, chat_id, extra={"chat_id": chat_id})
         return True
 
     def remove_group(self, chat_id):
-        initial_len = len(self.groups)
-        self.groups = [g for g in self.groups if g["_id"] != chat_id]
-        return len(self.groups) < initial_len
+        with self._lock:
+            # Same Int/String leniency as the MongoDB backend
+            removed = self.groups.pop(chat_id, None) or self.groups.pop(str(chat_id), None)
+            if removed:
+                self._group_removed(removed)
+        if removed:
+            logger.info("Removed group %s from database", chat_id, extra={"chat_id": chat_id})
+            return True
+        return False
 
     def get_all_groups(self):
-        return self.groups
+        with self._lock:
+            return list(self.groups.values())
+
+    def get_translation(self, chat_id):
+        with self._lock:
+            group = self.groups.get(chat_id)
+            return group["translation"] if group is not None else None
+
+    def set_translation(self, chat_id, translation):
+        with self._lock:
+            group = self.groups.get(chat_id)
+            if group is None:
+                return False
+            group["translation"] = translation
+            self._translation_changed(group)
+        return True
+
+    # Write-through hooks for durable subclasses. They run with self._lock held,
+    # so whatever they record happens in the same order as the in-memory change
+    def _group_added(self, group):
+        pass
+
+    def _group_removed(self, group):
+        pass
+
+    def _translation_changed(self, group):
+        pass
+
+class MockDatabase(InMemoryDatabase):
+    """A Fake Database for Local Testing (Used when Real DB fails)"""
+    def __init__(self):
+        super().__init__()
+        logger.warning("WARNING: RUNNING IN DUMMY MODE (Mock DB). Data will be lost on restart.")
+
+class SQLiteDatabase(InMemoryDatabase):
+    """Durable single-file backend for small deployments and benchmarks.
+
+    Reads are served from the in-memory index; writes are queued and
+    committed by a background thread in one transaction per batch.
+    """
+    backend = "sqlite"
+
+    def __init__(self, path, flush_interval=None, batch_size=None):
+        super().__init__()
+        self.path = path
+        self.flush_interval = flush_interval or SQLITE_FLUSH_INTERVAL
+        self.batch_size = batch_size or SQLITE_BATCH_SIZE
+        self._pending = []  # [(sql, params), ...] in submission order
+        self._pending_lock = threading.Lock()
+        self._conn_lock = threading.Lock()
+        self._wake = threading.Event()
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS subscribed_groups ("
+            "_id INTEGER PRIMARY KEY, name TEXT, joined_at INTEGER, created_at TEXT, translation TEXT)"
+        )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(subscribed_groups)")}
+        if "translation" not in columns:
+            # Files created before per-chat translations existed
+            self.conn.execute("ALTER TABLE subscribed_groups ADD COLUMN translation TEXT")
+        self.conn.commit()
+        self._load()
+
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+        atexit.register(self.flush)
+        logger.info("Using SQLite database at %s (%d groups)", path, len(self.groups))
+
+    def _load(self):
+        rows = self.conn.execute("SELECT _id, name, joined_at, created_at, translation FROM subscribed_groups")
+        for chat_id, name, joined_at, created_at, translation in rows:
+            self.groups[chat_id] = {
+                "_id": chat_id,
+                "name": name,
+                "joined_at": joined_at,
+                "translation": translation or BIBLE_TRANSLATION,
+                "created_at": datetime.fromisoformat(created_at) if created_at else None
+            }
+
+    def _enqueue(self, sql, params):
+        with self._pending_lock:
+            self._pending.append((sql, params))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def _group_added(self, group):
+        self._enqueue(
+            "INSERT OR REPLACE INTO subscribed_groups (_id, name, joined_at, created_at, translation) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (group["_id"], group["name"], group["joined_at"], group["created_at"].isoformat(), group["translation"])
+        )
+
+    def _group_removed(self, group):
+        self._enqueue("DELETE FROM subscribed_groups WHERE _id = ?", (group["_id"],))
+
+    def _translation_changed(self, group):
+        self._enqueue("UPDATE subscribed_groups SET translation = ? WHERE _id = ?", (group["translation"], group["_id"]))
+
+    def flush(self):
+        """Commit every queued write in a single transaction"""
+        # Held across swap and commit so concurrent flushes (atexit vs. the
+        # writer thread) can't commit their batches out of order
+        with self._conn_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+
+            try:
+                with self.conn:
+                    for sql, params in batch:
+                        self.conn.execute(sql, params)
+            except Exception as e:
+                logger.error("SQLite flush failed (%d writes requeued): %s", len(batch), e)
+                with self._pending_lock:
+                    self._pending[:0] = batch
+
+    def _flush_loop(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
 
-class Database:
+    def ping(self):
+        with self._conn_lock:
+            self.conn.execute("SELECT 1")
+
+class Database(SubscriberStore):
     """Database handler with connection pooling and error handling"""
+    backend = "mongodb"
     
     def __init__(self, uri):
         self.client = None
         self.db = None
         self.groups_col = None
+        self.translations = {}  # chat_id -> translation, so hot paths skip a round-trip
         self.connect(uri)
+        self.get_all_groups()  # Seeds self.translations
     
     def connect(self, uri):
         try:
@@ -181,7 +540,7 @@ class Database:
             self.groups_col = self.db["subscribed_groups"]
             logger.info("Connected to MongoDB successfully!")
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
+            logger.error("Failed to connect to MongoDB: %s", e)
             raise
     
     def add_group(self, chat_id, chat_name, joined_date):
@@ -192,23 +551,47 @@ class Database:
                     "_id": chat_id,
                     "name": chat_name,
                     "joined_at": joined_date,
+                    "translation": BIBLE_TRANSLATION,
                     "created_at": datetime.now(timezone.utc)
                 })
-                logger.info(f"Added new group: {chat_name} ({chat_id})")
+                self.translations[chat_id] = BIBLE_TRANSLATION
+                logger.info("Added new group: %s (%s)", chat_name, chat_id, extra={"chat_id": chat_id})
                 return True
-            logger.info(f"Group {chat_name} already exists in database")
+            logger.info("Group %s already exists in database", chat_name, extra={"chat_id": chat_id})
             return False
         except Exception as e:
-            logger.error(f"Error adding group to database: {e}")
+            logger.error("Error adding group to database: %s", e, extra={"chat_id": chat_id})
             return False
     
     def get_all_groups(self):
         """Retrieve all subscribed groups"""
         try:
-            return list(self.groups_col.find())
+            groups = list(self.groups_col.find())
+            self.translations = {g["_id"]: g.get("translation") or BIBLE_TRANSLATION for g in groups}
+            return groups
         except Exception as e:
-            logger.error(f"Error fetching groups from database: {e}")
+            logger.error("Error fetching groups from database: %s", e)
             return []
+
+    def get_translation(self, chat_id):
+        """Looks up a group's translation in the in-memory map (no MongoDB call)"""
+        translations = self.translations
+        return translations.get(chat_id) or translations.get(str(chat_id))
+
+    def set_translation(self, chat_id, translation):
+        """Store a group's default translation"""
+        try:
+            result = self.groups_col.update_one(
+                {"_id": {"$in": [chat_id, str(chat_id)]}},
+                {"$set": {"translation": translation}}
+            )
+            if result.matched_count == 0:
+                return False
+            self.translations[chat_id] = translation
+            return True
+        except Exception as e:
+            logger.error("Error updating group translation: %s", e, extra={"chat_id": chat_id})
+            return False
     
     def remove_group(self, chat_id):
         """Remove a group from the database"""
@@ -217,30 +600,39 @@ class Database:
             result_int = self.groups_col.delete_one({"_id": chat_id})
             result_str = self.groups_col.delete_one({"_id": str(chat_id)})
             
+            self.translations.pop(chat_id, None)
+            self.translations.pop(str(chat_id), None)
+            
             if result_int.deleted_count > 0 or result_str.deleted_count > 0:
-                logger.info(f"Removed group {chat_id} from database")
+                logger.info("Removed group %s from database", chat_id, extra={"chat_id": chat_id})
                 return True
             return False
         except Exception as e:
-            logger.error(f"Error removing group from database: {e}")
+            logger.error("Error removing group from database: %s", e, extra={"chat_id": chat_id})
             return False
 
+    def ping(self):
+        self.client.admin.command('ping')
+
 # --- SMART DATABASE SWITCH ---
 # FIX: Prevents "Zombie Mode" on production.
 db_handler = None
 
-if not MONGO_URI:
-    # Scenario 1: No Link provided (Local Testing / Random Editor)
+if not MONGO_URI and SQLITE_PATH:
+    # Scenario 1: Small deployment / benchmarks (Durable, no external service)
+    db_handler = SQLiteDatabase(SQLITE_PATH)
+elif not MONGO_URI:
+    # Scenario 2: No Link provided (Local Testing / Random Editor)
     logger.warning("⚠️ MONGO_URI not found. Using MockDatabase (Data will be lost on restart).")
     db_handler = MockDatabase()
 else:
-    # Scenario 2: Link provided (Production / Render)
+    # Scenario 3: Link provided (Production / Render)
     try:
         db_handler = Database(MONGO_URI)
     except Exception as e:
         # If the Real DB fails, we MUST crash so the server restarts.
         # Do not switch to MockDB here, or you will lose user data!
-        logger.critical(f"❌ Failed to connect to Real MongoDB: {e}")
+        logger.critical("❌ Failed to connect to Real MongoDB: %s", e)
         raise e  # Stops the bot completely
 
 # --- KEEP-ALIVE SERVER ---
@@ -258,17 +650,19 @@ def home():
 def health():
     """Health check endpoint"""
     try:
-        if isinstance(db_handler, Database):
-            db_handler.client.admin.command('ping')
-            db_status = "connected"
-        else:
+        if isinstance(db_handler, MockDatabase):
             db_status = "mock_mode"
+        else:
+            db_handler.ping()
+            db_status = "connected"
     except:
         db_status = "disconnected"
     
     return {
         "status": "healthy",
         "database": db_status,
+        "backend": db_handler.backend,
+        "polling": polling_metrics.snapshot(),
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
@@ -281,6 +675,44 @@ def keep_alive():
     t.start()
     logger.info("Keep-alive server started")
 
+# --- ADMIN PERMISSIONS CACHE ---
+
+class AdminCache:
+    """Per-chat set of admin user ids, seeded from get_chat_administrators.
+
+    Entries expire after a TTL and are dropped early by chat_member /
+    my_chat_member updates, so most permission checks never hit Telegram.
+    """
+    def __init__(self, ttl=ADMIN_CACHE_TTL):
+        self.ttl = ttl
+        self._admins = {}  # chat_id -> (expires_at, frozenset of user ids)
+        self._lock = threading.Lock()
+
+    def get_admins(self, chat_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._admins.get(chat_id)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        admins = frozenset(member.user.id for member in bot.get_chat_administrators(chat_id))
+        with self._lock:
+            self._admins[chat_id] = (now + self.ttl, admins)
+        return admins
+
+    def is_admin(self, chat_id, user_id):
+        return user_id in self.get_admins(chat_id)
+
+    def invalidate(self, chat_id):
+        with self._lock:
+            self._admins.pop(chat_id, None)
+
+admin_cache = AdminCache()
+
+def is_group_admin(m):
+    """True if the sender is an Admin/Creator of this chat, or the Bot Owner"""
+    return m.from_user.id == ADMIN_ID or admin_cache.is_admin(m.chat.id, m.from_user.id)
+
 # --- HELPER FUNCTIONS ---
 
 def main_menu_keyboard():
@@ -297,34 +729,44 @@ def main_menu_keyboard():
 
 def get_verse_markup(verse_data, current_translation="web"):
     """Creates Inline Buttons for Sharing and Translation Switching"""
+    return _build_verse_markup(verse_data['reference'], verse_data['text'], current_translation)
+
+@functools.lru_cache(maxsize=VERSE_MARKUP_CACHE_SIZE)
+def _build_verse_markup(ref, text, current_translation):
+    """Memoized per (verse, translation); returns the keyboard already serialized to JSON"""
     markup = telebot.types.InlineKeyboardMarkup()
     
     # 1. Share Button (Uses Telegram Share URL)
     # Reverted to clean share without promotional header
-    share_text = f"{verse_data['reference']} ({current_translation.upper()})\n\n{verse_data['text']}"
+    share_text = f"{ref} ({current_translation.upper()})\n\n{text}"
     
     share_url = f"https://t.me/share/url?url={requests.utils.quote(share_text)}"
     markup.add(telebot.types.InlineKeyboardButton("📤 Share with Friends", url=share_url))
     
     # 2. Translation Buttons
-    ref = verse_data['reference']
+    # Buttons carry a packed numeric ID ("trans|kjv|721620992") so even
+    # long references stay under Telegram's 64-byte callback_data limit
+    verse_id = encode_verse_id(ref)
+    payload = str(verse_id) if verse_id is not None else ref
+    if len(f"trans|web|{payload}".encode()) > CALLBACK_DATA_LIMIT:
+        return markup.to_json()  # Unencodable and too long: share button only
     
     # Create row of buttons. Highlight the current one with brackets []
     btn_web = telebot.types.InlineKeyboardButton(
         "[WEB]" if current_translation == "web" else "WEB", 
-        callback_data=f"trans|web|{ref}"
+        callback_data=f"trans|web|{payload}"
     )
     btn_kjv = telebot.types.InlineKeyboardButton(
         "[KJV]" if current_translation == "kjv" else "KJV", 
-        callback_data=f"trans|kjv|{ref}"
+        callback_data=f"trans|kjv|{payload}"
     )
     btn_bbe = telebot.types.InlineKeyboardButton(
         "[BBE]" if current_translation == "bbe" else "BBE", 
-        callback_data=f"trans|bbe|{ref}"
+        callback_data=f"trans|bbe|{payload}"
     )
     
     markup.row(btn_web, btn_kjv, btn_bbe)
-    return markup
+    return markup.to_json()
 
 def load_verse_references():
     try:
@@ -348,10 +790,18 @@ def fetch_verse_from_api(reference, translation="web"):
         response.raise_for_status()
         return response.json() # Returns the raw data dictionary
     except Exception as e:
-        logger.error(f"API request failed: {e}")
+        logger.error("API request failed: %s", e, extra={"reference": reference})
         return None
 
-def get_random_verse():
+def format_verse(verse_data, translation):
+    """Message body for a verse: bold reference, translation tag, text"""
+    return f"*{verse_data['reference']}* ({translation.upper()})\n\n{verse_data['text'].strip()}"
+
+def get_chat_translation(chat_id):
+    """The chat's preferred translation (WEB if unset or not subscribed)"""
+    return db_handler.get_translation(chat_id) or BIBLE_TRANSLATION
+
+def get_random_verse(translation=BIBLE_TRANSLATION):
     verse_list = load_verse_references()
     
     # Try 3 times to get a verse
@@ -359,7 +809,7 @@ def get_random_verse():
         # Pick reference
         selected_ref = random.choice(verse_list) if verse_list else "John 3:16"
         # Fetch data
-        verse_data = fetch_verse_from_api(selected_ref)
+        verse_data = fetch_verse_from_api(selected_ref, translation)
         if verse_data:
             return verse_data # Returns dictionary: {'reference': '...', 'text': '...'}
         time.sleep(0.5)
@@ -369,41 +819,56 @@ def get_random_verse():
 
 def send_morning_verse():
     logger.info("Starting morning verse broadcast...")
-    data = get_random_verse()
+    base_data = get_random_verse()
     
-    # Prepare text and buttons
-    text = f"*{data['reference']}* (WEB)\n\n{data['text'].strip()}"
-    markup = get_verse_markup(data, "web")
+    # Partition subscribers by their default translation
+    partitions = {}
+    for group in db_handler.get_all_groups():
+        translation = group.get("translation") or BIBLE_TRANSLATION
+        partitions.setdefault(translation, []).append(group["_id"])
     
-    all_groups = db_handler.get_all_groups()
     success_count = 0
     
-    for group in all_groups:
-        chat_id = group["_id"]
-        try:
-            bot.send_message(chat_id, f"*Good Morning!*\n\n{text}", reply_markup=markup)
-            success_count += 1
-            time.sleep(0.5)
-        except telebot.apihelper.ApiTelegramException as e:
-            if e.error_code in [403, 400]:
-                db_handler.remove_group(chat_id)
-            else:
-                logger.error(f"Failed to send to {chat_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error sending to {chat_id}: {e}")
+    for translation, chat_ids in partitions.items():
+        # Fetch each translation exactly once and pre-render its message
+        data = base_data
+        if translation != BIBLE_TRANSLATION:
+            data = fetch_verse_from_api(base_data['reference'], translation)
+            if not data:
+                # Better a WEB verse than no verse at all
+                data, translation = base_data, BIBLE_TRANSLATION
+        
+        text = f"*Good Morning!*\n\n{format_verse(data, translation)}"
+        markup = get_verse_markup(data, translation)
+        
+        for chat_id in chat_ids:
+            try:
+                bot.send_message(chat_id, text, reply_markup=markup)
+                success_count += 1
+                time.sleep(0.5)
+            except telebot.apihelper.ApiTelegramException as e:
+                if e.error_code in [403, 400]:
+                    db_handler.remove_group(chat_id)
+                else:
+                    logger.error("Failed to send to %s: %s", chat_id, e, extra={"chat_id": chat_id, "handler": "send_morning_verse"})
+            except Exception as e:
+                logger.error("Error sending to %s: %s", chat_id, e, extra={"chat_id": chat_id, "handler": "send_morning_verse"})
     
-    logger.info(f"Broadcast complete. Success: {success_count}")
+    logger.info(
+        "Broadcast complete. Success: %d (translations: %s)", success_count, ", ".join(partitions) or "none",
+        extra={"handler": "send_morning_verse"}
+    )
 
 # --- SCHEDULER ---
 schedule.every().day.at(MORNING_VERSE_TIME).do(send_morning_verse)
 
 def run_scheduler():
-    logger.info(f"Scheduler started. Morning verses at {MORNING_VERSE_TIME} UTC")
+    logger.info("Scheduler started. Morning verses at %s UTC", MORNING_VERSE_TIME)
     while True:
         try:
             schedule.run_pending()
         except Exception as e:
-            logger.error(f"Scheduler error: {e}")
+            logger.error("Scheduler error: %s", e)
         time.sleep(60)
 
 # --- BOT COMMAND HANDLERS ---
@@ -439,6 +904,7 @@ def send_help(message):
         "/verse - Fetch a random scripture\n"
         "/ping - Check Online Status\n"
         "/register - Manually register this group for daily verses\n"
+        "/translation - Set this chat's Bible translation (WEB, KJV, BBE)\n"
         "/start - Restart the bot menu"
     )
     bot.reply_to(message, help_text)
@@ -471,7 +937,10 @@ def force_verse(m):
     # SECURITY CHECK: Is this the Admin?
     if m.from_user.id != ADMIN_ID:
         # Log the attempt so you know someone tried it
-        logger.warning(f"Unauthorized broadcast attempt by {m.from_user.first_name} (ID: {m.from_user.id})")
+        logger.warning(
+            "Unauthorized broadcast attempt by %s (ID: %s)", m.from_user.first_name, m.from_user.id,
+            extra={"chat_id": m.chat.id, "user_id": m.from_user.id, "handler": "force_verse"}
+        )
         # Ignore them (Security through silence)
         return
 
@@ -491,11 +960,9 @@ def reset_group(m):
             return
 
         # 2. Group Chat Logic (SECURITY CHECK)
-        # Check if the user is an Admin or Creator
-        member = bot.get_chat_member(m.chat.id, m.from_user.id)
-        
         # Allow if they are Admin, Creator, OR if it is YOU (The Bot Owner)
-        if member.status not in ['administrator', 'creator'] and m.from_user.id != ADMIN_ID:
+        # Uses the cached admin list instead of a get_chat_member round-trip
+        if not is_group_admin(m):
             bot.reply_to(m, "❌ Permission Denied. Only Group Admins can run this command.")
             return
 
@@ -508,32 +975,67 @@ def reset_group(m):
     except Exception as e:
         bot.reply_to(m, f"Error: {e}")
 
+@bot.message_handler(commands=["translation"])
+def choose_translation(m):
+    """Shows or sets the chat's default translation (Admins Only in Groups)"""
+    try:
+        parts = m.text.split()
+        choices = ", ".join(t.upper() for t in SUPPORTED_TRANSLATIONS)
+        
+        # 1. No argument: just report the current setting
+        if len(parts) < 2:
+            current = get_chat_translation(m.chat.id)
+            bot.reply_to(m, f"Current translation: {current.upper()}\n\nUsage: /translation <{choices}>")
+            return
+        
+        translation = parts[1].lower()
+        if translation not in SUPPORTED_TRANSLATIONS:
+            bot.reply_to(m, f"Unknown translation. Choose one of: {choices}")
+            return
+        
+        # 2. Group Chat Logic (SECURITY CHECK)
+        if m.chat.type != "private" and not is_group_admin(m):
+            bot.reply_to(m, "❌ Permission Denied. Only Group Admins can run this command.")
+            return
+        
+        # 3. Save it on the subscription
+        if db_handler.set_translation(m.chat.id, translation):
+            bot.reply_to(m, f"📖 Daily verses here will now use {translation.upper()}.")
+        else:
+            bot.reply_to(m, "This chat is not subscribed yet. Use /register (groups) or Subscribe (DMs) first.")
+    
+    except Exception as e:
+        bot.reply_to(m, f"Error: {e}")
+
 @bot.message_handler(commands=["verse"])
 def send_verse(message):
     try:
-        # 1. Get Dictionary Data
-        data = get_random_verse()
+        # 1. Get Dictionary Data (in this chat's preferred translation)
+        translation = get_chat_translation(message.chat.id)
+        data = get_random_verse(translation)
+        if data is DEFAULT_VERSE:
+            translation = BIBLE_TRANSLATION  # The offline fallback is WEB text
         
         # 2. Format Text
-        msg_text = f"*{data['reference']}* (WEB)\n\n{data['text'].strip()}"
+        msg_text = format_verse(data, translation)
         
         # 3. Create Buttons using the helper function
-        markup = get_verse_markup(data, "web")
+        markup = get_verse_markup(data, translation)
         
         # 4. Send with Buttons
         bot.reply_to(message, msg_text, reply_markup=markup)
     except Exception as e:
-        logger.error(f"Error in /verse command: {e}")
+        logger.error("Error in /verse command: %s", e, extra={"chat_id": message.chat.id, "handler": "send_verse"})
         bot.reply_to(message, "Error fetching verse.")
 
 @bot.message_handler(commands=["ping"])
 def ping(message):
     try:
-        if isinstance(db_handler, Database):
-            db_handler.client.admin.command('ping')
-            db_status = "Connected"
-        else:
+        if isinstance(db_handler, MockDatabase):
             db_status = "Mock DB (Test Mode)"
+        else:
+            db_handler.ping()
+            db_status = f"Connected ({db_handler.backend})"
     except:
         db_status = "Disconnected"
     
@@ -579,19 +1081,34 @@ def on_leave(message):
         chat_id = message.chat.id
         db_handler.remove_group(chat_id)
 
+@bot.chat_member_handler()
+def on_chat_member_update(update):
+    """Drops the cached admin list when someone is promoted or demoted"""
+    old_status = update.old_chat_member.status
+    new_status = update.new_chat_member.status
+    if old_status != new_status and (old_status in ADMIN_STATUSES or new_status in ADMIN_STATUSES):
+        admin_cache.invalidate(update.chat.id)
+
+@bot.my_chat_member_handler()
+def on_my_chat_member_update(update):
+    """Theo's own membership changed (added, promoted, kicked): re-seed on next check"""
+    admin_cache.invalidate(update.chat.id)
+
 @bot.callback_query_handler(func=lambda call: call.data.startswith("trans|"))
 def handle_translation_switch(call):
     """Updates the verse text when a translation button is clicked"""
     try:
-        # Parse the data we hid in the button: "trans|kjv|John 3:16"
-        _, new_trans, ref = call.data.split("|", 2)
+        # Parse the data we hid in the button: "trans|kjv|721620992"
+        # (Older messages still carry the raw reference: "trans|kjv|John 3:16")
+        _, new_trans, payload = call.data.split("|", 2)
+        ref = decode_verse_id(int(payload)) if payload.isdigit() else payload
         
         # Fetch the NEW translation
         new_data = fetch_verse_from_api(ref, new_trans)
         
         if new_data:
             # Create the new text
-            new_text = f"*{new_data['reference']}* ({new_trans.upper()})\n\n{new_data['text'].strip()}"
+            new_text = format_verse(new_data, new_trans)
             
             # Update the message in the chat (Edit Message)
             bot.edit_message_text(
@@ -604,7 +1121,10 @@ def handle_translation_switch(call):
             bot.answer_callback_query(call.id, f"Switched to {new_trans.upper()}")
             
     except Exception as e:
-        logger.error(f"Translation switch failed: {e}")
+        logger.error(
+            "Translation switch failed: %s", e,
+            extra={"chat_id": call.message.chat.id, "handler": "handle_translation_switch"}
+        )
         bot.answer_callback_query(call.id, "Failed to switch translation.")
 
 # --- PASSIVE LISTENER HANDLER (MUST BE ABOVE HANDLE_TEXT) ---
@@ -630,22 +1150,29 @@ def handle_passive_verse(message):
         
         # 4. Fetch from API
         # We pass the constructed reference to your existing function
-        data = fetch_verse_from_api(reference)
+        translation = get_chat_translation(message.chat.id)
+        data = fetch_verse_from_api(reference, translation)
         
         if data:
             # 5. Send Reply (Using your existing Button Helper)
             # We use 'reply_to_message_id' so Theo quotes the specific message
-            text = f"*{data['reference']}* (WEB)\n\n{data['text'].strip()}"
-            markup = get_verse_markup(data, "web")
+            text = format_verse(data, translation)
+            markup = get_verse_markup(data, translation)
             
             bot.reply_to(message, text, reply_markup=markup)
             
             # Log it so you know it's working
-            logger.info(f"Auto-detected verse: {reference} from {message.from_user.first_name}")
+            logger.info(
+                "Auto-detected verse: %s from %s", reference, message.from_user.first_name,
+                extra={"chat_id": message.chat.id, "handler": "handle_passive_verse", "reference": reference}
+            )
             
     except Exception as e:
         # If it wasn't a real verse (e.g. 'Matrix 1:1'), just stay silent
-        logger.warning(f"Passive listener error: {e}")
+        logger.warning(
+            "Passive listener error: %s", e,
+            extra={"chat_id": message.chat.id, "handler": "handle_passive_verse"}
+        )
 
 # --- TEXT HANDLER (MUST BE LAST) ---
 @bot.message_handler(func=lambda m: True)
@@ -672,6 +1199,212 @@ def handle_text(m):
     elif m.chat.type == "private":
          bot.reply_to(m, "I didn't recognize that command. Use the buttons below.", reply_markup=main_menu_keyboard())
 
+# --- POLLING ---
+# Triage order while draining a backlog: state changes, then commands, then chatter
+PRIORITY_STATE, PRIORITY_COMMAND, PRIORITY_PASSIVE = 0, 1, 2
+
+class PollingMetrics:
+    """Counters and update-lag stats for the polling loop (served on /health).
+
+    Live lag is tracked per POLL_LAG_WINDOW; the startup backlog is reported
+    on its own so one slow restart doesn't dominate the numbers forever.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.received = 0
+        self.dispatched = 0
+        self.dropped_stale = 0
+        self.failures = 0
+        self.last_lag = None  # Oldest update in the last live batch, in seconds
+        self.window_max_lag = 0.0
+        self.window_started = time.monotonic()
+        self.avg_lag = None  # Exponential moving average over live updates
+        self.last_batch_at = None
+        self.backlog_updates = 0
+        self.backlog_max_lag = None
+
+    def record_batch(self, received, lags, dropped, backlog=False):
+        with self._lock:
+            self.received += received
+            self.dispatched += received - dropped
+            self.dropped_stale += dropped
+            self.last_batch_at = datetime.now(timezone.utc).isoformat()
+            if backlog:
+                self.backlog_updates += received
+                if lags:
+                    self.backlog_max_lag = max(lags)
+                return
+
+            if lags:
+                self.last_lag = max(lags)
+                self._roll_window()
+                self.window_max_lag = max(self.window_max_lag, self.last_lag)
+                for lag in lags:
+                    self.avg_lag = lag if self.avg_lag is None else 0.9 * self.avg_lag + 0.1 * lag
+
+    def _roll_window(self):
+        now = time.monotonic()
+        if now - self.window_started >= POLL_LAG_WINDOW:
+            self.window_started = now
+            self.window_max_lag = 0.0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def snapshot(self):
+        with self._lock:
+            self._roll_window()
+            return {
+                "updates_received": self.received,
+                "updates_dispatched": self.dispatched,
+                "dropped_stale": self.dropped_stale,
+                "poll_failures": self.failures,
+                "last_lag_seconds": self.last_lag,
+                "max_lag_seconds": self.window_max_lag,
+                "lag_window_seconds": POLL_LAG_WINDOW,
+                "avg_lag_seconds": round(self.avg_lag, 3) if self.avg_lag is not None else None,
+                "startup_backlog_updates": self.backlog_updates,
+                "startup_backlog_max_lag_seconds": self.backlog_max_lag,
+                "last_batch_at": self.last_batch_at
+            }
+
+polling_metrics = PollingMetrics()
+
+def update_timestamp(update):
+    """When the user acted (callback queries only carry the original message's date)"""
+    # An edit's .date is when the original was sent; edit_date is when it changed
+    for edit in (update.edited_message, update.edited_channel_post):
+        if edit is not None:
+            return edit.edit_date or edit.date
+    for event in (update.message, update.channel_post, update.chat_member, update.my_chat_member):
+        if event is not None:
+            return event.date
+    return None
+
+def update_priority(update):
+    if update.my_chat_member or update.chat_member:
+        return PRIORITY_STATE
+    if update.callback_query:
+        return PRIORITY_COMMAND
+
+    message = update.message
+    if message is None:
+        return PRIORITY_PASSIVE
+    if message.content_type in ("new_chat_members", "left_chat_member"):
+        return PRIORITY_STATE
+    text = message.text or ""
+    if text.startswith("/") or text in MENU_BUTTONS:
+        return PRIORITY_COMMAND
+    return PRIORITY_PASSIVE
+
+def dispatch_updates(updates, backlog=False):
+    """Drops stale passive chatter and hands the rest to telebot one priority tier at a time"""
+    now = time.time()
+    tiers = {PRIORITY_STATE: [], PRIORITY_COMMAND: [], PRIORITY_PASSIVE: []}
+    lags, dropped = [], 0
+
+    for update in updates:
+        timestamp = update_timestamp(update)
+        age = now - timestamp if timestamp else None
+        priority = update_priority(update)
+        # Only chatter goes stale: commands and join/leave events still matter
+        if priority == PRIORITY_PASSIVE and age is not None and age > POLL_STALE_AFTER:
+            dropped += 1
+            continue
+        if age is not None:
+            lags.append(age)
+        tiers[priority].append(update)
+
+    polling_metrics.record_batch(len(updates), lags, dropped, backlog=backlog)
+    # process_new_updates regroups a batch by update type (all messages, then
+    # callbacks, then member updates), so one call per tier is what keeps
+    # state changes ahead of commands and commands ahead of chatter
+    for priority in sorted(tiers):
+        if tiers[priority]:
+            bot.process_new_updates(tiers[priority])
+    return dropped
+
+def check_handler_errors():
+    """Logs the exception a worker-thread handler left behind since the last check.
+
+    With threaded=True, telebot stores handler exceptions on its worker pool
+    and expects the polling loop to surface them (infinity_polling did).
+    """
+    worker_pool = getattr(bot, "worker_pool", None)
+    if worker_pool is None:
+        return
+    try:
+        worker_pool.raise_exceptions()
+    except Exception as e:
+        polling_metrics.record_failure()
+        logger.error("Update handler failed: %s", e, exc_info=e)
+    finally:
+        worker_pool.clear_exceptions()
+
+def fetch_updates(offset, long_polling_timeout):
+    # chat_member updates are opt-in; they keep the admin cache fresh
+    return bot.get_updates(
+        offset=offset, limit=POLL_PAGE_SIZE, timeout=POLL_TIMEOUT,
+        long_polling_timeout=long_polling_timeout, allowed_updates=telebot.util.update_types
+    )
+
+def poll_updates():
+    """Long-polls getUpdates forever, backing off exponentially on failures.
+
+    On startup, pages queued while Theo was down are collected first and
+    dispatched together so the whole backlog is triaged by priority.
+    """
+    offset = None
+    backoff = POLL_BACKOFF_MIN
+    started_at = time.time()
+    draining = True
+    # Lives outside the try: each getUpdates call confirms the previous page on
+    # Telegram's side, so a failed fetch must not throw away what we already hold
+    backlog = []
+
+    while True:
+        try:
+            check_handler_errors()
+
+            if draining:
+                # telebot treats a timeout of 0 as "use the default" (10s), so ask
+                # for the shortest real wait to keep the tail of the drain quick
+                page = fetch_updates(offset, POLL_DRAIN_TIMEOUT)
+                backlog.extend(page)
+                if page:
+                    offset = page[-1].update_id + 1
+
+                # A short page, or anything sent after startup, means we've caught up
+                caught_up = len(page) < POLL_PAGE_SIZE or any(
+                    (update_timestamp(update) or 0) >= started_at for update in page
+                )
+                if caught_up:
+                    draining = False
+                    if backlog:
+                        dropped = dispatch_updates(backlog, backlog=True)
+                        logger.info("Startup backlog: %d updates, %d stale dropped", len(backlog), dropped)
+                    backlog = []
+                backoff = POLL_BACKOFF_MIN
+                continue
+
+            updates = fetch_updates(offset, POLL_TIMEOUT)
+            if updates:
+                offset = updates[-1].update_id + 1
+                dispatch_updates(updates)
+            backoff = POLL_BACKOFF_MIN
+
+        except Exception as e:
+            delay = backoff
+            if isinstance(e, telebot.apihelper.ApiTelegramException) and e.error_code == 429:
+                # Flood control: Telegram says exactly how long to wait
+                retry_after = (e.result_json or {}).get("parameters", {}).get("retry_after", 0)
+                delay = max(delay, retry_after)
+            polling_metrics.record_failure()
+            logger.error("Bot polling failed: %s (retrying in %ds)", e, delay)
+            time.sleep(delay)
+            backoff = min(backoff * 2, POLL_BACKOFF_MAX)
+
 # --- MAIN EXECUTION ---
 if __name__ == "__main__":
     logger.info("Starting Theo Bot...")
@@ -682,6 +1415,7 @@ if __name__ == "__main__":
     desc_ping = "ᴄʜᴇᴄᴋ ᴄᴏɴɴᴇᴄᴛɪᴏɴ sᴛᴀᴛᴜs"
     desc_start = "ʀᴇsᴛᴀʀᴛ ʙᴏᴛ ɪɴᴛᴇʀᴀᴄᴛɪᴏɴ"
     desc_reg = "ʀᴇɢɪsᴛᴇʀ ɢʀᴏᴜᴘ ғᴏʀ ᴅᴀɪʟʏ ᴠᴇʀsᴇs"
+    desc_trans = "sᴇᴛ ᴅᴇғᴀᴜʟᴛ ᴛʀᴀɴsʟᴀᴛɪᴏɴ"
 
     # --- SMART MENU SYSTEM ---
     try:
@@ -701,6 +1435,7 @@ if __name__ == "__main__":
             commands=[
                 telebot.types.BotCommand("verse", desc_verse),
                 telebot.types.BotCommand("register", desc_reg),
+                telebot.types.BotCommand("translation", desc_trans),
                 telebot.types.BotCommand("help", desc_help),
                 telebot.types.BotCommand("ping", desc_ping)
             ],
@@ -708,7 +1443,7 @@ if __name__ == "__main__":
         )
         logger.info("Smart menus set successfully")
     except Exception as e:
-        logger.error(f"Failed to set menus: {e}")
+        logger.error("Failed to set menus: %s", e)
 
     # Start keep-alive server
     keep_alive()
@@ -720,11 +1455,4 @@ if __name__ == "__main__":
     # Start bot polling
     logger.info("Theo is now running and ready to serve!")
     
-    while True:
-        try:
-            bot.infinity_polling(timeout=60, long_polling_timeout=60)
-        except Exception as e:
-            logger.error(f"Bot polling crashed: {e}")
-            time.sleep(5)
-            logger.info("Attempting to restart polling...")
-            continue
\ No newline at end of file
+    poll_updates()